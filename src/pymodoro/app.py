@@ -115,7 +115,7 @@ class PomodoroApp(QtCore.QObject):
         duration = (end - start).total_seconds()
         if duration < MIN_SESSION_DURATION_SEC:
             phase = transition.previous_phase.value
-            logger.debug(f"Skipping short {phase!r} session ({duration:.0f}s)")
+            logger.debug("Skipping short {!r} session ({:.0f}s)", phase, duration)
             return
 
         record = SessionRecord(
@@ -79,7 +79,7 @@ class AppWindow(QtWidgets.QMainWindow):
 
     # ---- Navigation handlers ----------------------------------------------
     def navigate_to_page(self, page: Page) -> None:
-        logger.info(f"Navigating to page: {page}")
+        logger.info("Navigating to page: {}", page)
         self.sidebar.set_current_page(page)
         self.main_area.show_page(page)
 
@@ -16,6 +16,15 @@ from pymodoro.metrics_io import (
 )
 from pymodoro.settings import AppSettings
 
+AlignLeftTop = QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop
+AlignLeftVCenter = (
+    QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter
+)
+HighlightRole = QtGui.QPalette.ColorRole.Highlight
+HighlightedTextRole = QtGui.QPalette.ColorRole.HighlightedText
+MidRole = QtGui.QPalette.ColorRole.Mid
+WindowTextRole = QtGui.QPalette.ColorRole.WindowText
+
 # ---------------------------------------------------------------------------
 # Configurable constants (§3.9)
 # ---------------------------------------------------------------------------
@@ -180,8 +189,8 @@ class SessionCardItem(QtWidgets.QGraphicsRectItem):
         super().__init__(x, y, w, h, parent)
         self.block = block
         palette = QtWidgets.QApplication.palette()
-        self._base_color = palette.color(QtGui.QPalette.ColorRole.Highlight)
-        self._text_color = palette.color(QtGui.QPalette.ColorRole.HighlightedText)
+        self._base_color = palette.color(HighlightRole)
+        self._text_color = palette.color(HighlightedTextRole)
         self._hover = False
         self.setAcceptHoverEvents(True)
         self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
@@ -224,17 +233,11 @@ class SessionCardItem(QtWidgets.QGraphicsRectItem):
             font.setBold(True)
             painter.setFont(font)
             text_rect = rect.adjusted(5, 3, -14, 0)
-            painter.drawText(
-                text_rect,
-                QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop,
-                label,
-            )
+            painter.drawText(text_rect, AlignLeftTop, label)
             font.setBold(False)
             painter.setFont(font)
             painter.drawText(
-                text_rect.adjusted(0, 14, 0, 0),
-                QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop,
-                f"{duration_min}m",
+                text_rect.adjusted(0, 14, 0, 0), AlignLeftTop, f"{duration_min}m"
             )
         elif h >= CC["CARD_LABEL_COMPACT_HEIGHT_PX"]:
             font = painter.font()
@@ -242,8 +245,7 @@ class SessionCardItem(QtWidgets.QGraphicsRectItem):
             painter.setFont(font)
             painter.drawText(
                 rect.adjusted(4, 1, -4, -1),
-                QtCore.Qt.AlignmentFlag.AlignLeft
-                | QtCore.Qt.AlignmentFlag.AlignVCenter,
+                AlignLeftVCenter,
                 f"{label} {duration_min}m",
             )
 
@@ -306,9 +308,17 @@ class _DayHeaderWidget(QtWidgets.QWidget):
         col_w = (w - self._left_margin) / self._day_count
 
         palette = QtWidgets.QApplication.palette()
-        text_color = palette.color(QtGui.QPalette.ColorRole.WindowText)
+        text_color = palette.color(WindowTextRole)
         today = date.today()
 
+        # Fonts are identical for every column; build them once per paint.
+        abbr_font = QtGui.QFont(painter.font())
+        abbr_font.setPixelSize(11)
+        abbr_today_font = QtGui.QFont(abbr_font)
+        abbr_today_font.setBold(True)
+        day_font = QtGui.QFont(abbr_today_font)
+        day_font.setPixelSize(14)
+
         for i in range(self._day_count):
             d = self._week_start + timedelta(days=i)
             x = self._left_margin + i * col_w
@@ -316,15 +326,8 @@ class _DayHeaderWidget(QtWidgets.QWidget):
 
             # Day abbreviation
             abbr = d.strftime("%a").upper()
-            abbr_font = QtGui.QFont(painter.font())
-            abbr_font.setPixelSize(11)
-            abbr_font.setBold(is_today)
-            painter.setFont(abbr_font)
-            abbr_color = (
-                palette.color(QtGui.QPalette.ColorRole.Highlight)
-                if is_today
-                else text_color
-            )
+            painter.setFont(abbr_today_font if is_today else abbr_font)
+            abbr_color = palette.color(HighlightRole) if is_today else text_color
             painter.setPen(abbr_color)
             abbr_rect = painter.fontMetrics().boundingRect(abbr)
             abbr_x = x + col_w / 2 - abbr_rect.width() / 2
@@ -332,9 +335,6 @@ class _DayHeaderWidget(QtWidgets.QWidget):
 
             # Day number
             day_str = str(d.day)
-            day_font = QtGui.QFont(painter.font())
-            day_font.setPixelSize(14)
-            day_font.setBold(True)
             painter.setFont(day_font)
             fm = painter.fontMetrics()
             day_br = fm.boundingRect(day_str)
@@ -344,7 +344,7 @@ class _DayHeaderWidget(QtWidgets.QWidget):
             if is_today:
                 circle_r = max(day_br.width(), day_br.height()) / 2 + 4
                 painter.setPen(QtCore.Qt.PenStyle.NoPen)
-                painter.setBrush(palette.color(QtGui.QPalette.ColorRole.Highlight))
+                painter.setBrush(palette.color(HighlightRole))
                 painter.drawEllipse(QtCore.QPointF(cx, cy), circle_r, circle_r)
                 painter.setPen(QtGui.QColor("white"))
                 painter.drawText(
@@ -384,9 +384,7 @@ class CalendarGridView(QtWidgets.QWidget):
         self._header = _DayHeaderWidget(self)
         self._scene = QtWidgets.QGraphicsScene(self)
         self._view = QtWidgets.QGraphicsView(self._scene, self)
-        self._view.setAlignment(
-            QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop
-        )
+        self._view.setAlignment(AlignLeftTop)
         self._view.setHorizontalScrollBarPolicy(
             QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff
         )
@@ -403,6 +401,7 @@ class CalendarGridView(QtWidgets.QWidget):
         # Current-time timer
         self._time_indicator: CurrentTimeIndicator | None = None
         self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
         self._timer.timeout.connect(self._update_time_indicator)
         self._timer.start(60_000)
 
@@ -465,8 +464,8 @@ class CalendarGridView(QtWidgets.QWidget):
         self._grid_h = grid_h
 
         palette = QtWidgets.QApplication.palette()
-        text_color = palette.color(QtGui.QPalette.ColorRole.WindowText)
-        line_color = palette.color(QtGui.QPalette.ColorRole.Mid)
+        text_color = palette.color(WindowTextRole)
+        line_color = palette.color(MidRole)
         today = date.today()
 
         # --- Grid area ---
@@ -476,7 +475,7 @@ class CalendarGridView(QtWidgets.QWidget):
             d = self._week_start + timedelta(days=i)
             if d == today:
                 x = LEFT_MARGIN + i * col_w
-                tint = QtGui.QColor(palette.color(QtGui.QPalette.ColorRole.Highlight))
+                tint = QtGui.QColor(palette.color(HighlightRole))
                 tint.setAlphaF(0.06)
                 self._scene.addRect(
                     x,
@@ -666,7 +665,7 @@ class _SessionTooltip(QtWidgets.QFrame):
 
         disabled_text_color = self.palette().color(
             QtGui.QPalette.ColorGroup.Disabled,
-            QtGui.QPalette.ColorRole.WindowText,
+            WindowTextRole,
         )
 
         duration_min = int((block.end - block.start).total_seconds()) // 60
@@ -31,7 +31,7 @@ AUTOSAVE_DEBOUNCE_MS = 300
 
 class SettingsPanel(QWidget):
     settingsSaved = QtCore.Signal()
-    pauseUntilRequested = QtCore.Signal(object)
+    pauseUntilRequested = QtCore.Signal(QtCore.QDateTime)
     resumeRequested = QtCore.Signal()
     startWorkRequested = QtCore.Signal(int)
     startBreakRequested = QtCore.Signal(int)
@@ -44,9 +44,11 @@ class SettingsPanel(QWidget):
         super().__init__(parent)
         self._settings = settings
         self._is_paused = False
+        self._pause_dialog: PauseUntilDialog | None = None
 
         self._debounce_timer = QtCore.QTimer(self)
         self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
         self._debounce_timer.setInterval(AUTOSAVE_DEBOUNCE_MS)
         self._debounce_timer.timeout.connect(self._auto_save)
 
@@ -121,9 +123,12 @@ class SettingsPanel(QWidget):
 
     def _prompt_pause_until(self) -> QtCore.QDateTime | None:
         default_datetime = QtCore.QDateTime.currentDateTime().addSecs(3600)
-        dialog = PauseUntilDialog(default_datetime, self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            return dialog.selected_datetime()
+        if self._pause_dialog is None:
+            self._pause_dialog = PauseUntilDialog(default_datetime, self)
+        else:
+            self._pause_dialog.set_datetime(default_datetime)
+        if self._pause_dialog.exec() == QDialog.DialogCode.Accepted:
+            return self._pause_dialog.selected_datetime()
 
     def _on_pause_resume_clicked(self) -> None:
         if self._is_paused:
@@ -166,6 +171,17 @@ class SettingsPanel(QWidget):
         except ValidationError:
             logger.debug("Skipping auto-save: validation failed")
             return
+        check_in = self._settings.check_in
+        if (
+            timers == self._settings.timers
+            and check_in_prompts == check_in.prompts
+            and check_in_projects == check_in.projects
+            and check_in_exercises == check_in.exercises
+            and check_in_activities == check_in.activities
+            and sound_enabled == self._settings.notification_sound_enabled
+        ):
+            logger.debug("Skipping auto-save: nothing changed")
+            return
         self._settings.timers = timers
         self._settings.check_in.prompts = check_in_prompts
         self._settings.check_in.projects = check_in_projects
@@ -23,9 +23,12 @@ from PySide6.QtWidgets import (
 DELETE_CHAR = "\u00d7"
 DURATION_INPUT_MAX_WIDTH = 120
 
+Expanding = QSizePolicy.Policy.Expanding
+Fixed = QSizePolicy.Policy.Fixed
+
 
 class ListEditorRow(QWidget):
-    deleteClicked = QtCore.Signal()
+    deleteClicked = QtCore.Signal(object)  # ListEditorRow – the row itself
 
     def __init__(self, text: str, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -34,19 +37,21 @@ class ListEditorRow(QWidget):
         row_layout.setSpacing(6)
 
         self._label = QLabel(text)
-        self._label.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed
-        )
+        self._label.setSizePolicy(Expanding, Fixed)
         row_layout.addWidget(self._label, 1)
 
         delete_btn = QPushButton(DELETE_CHAR)
         delete_btn.setFixedSize(24, 24)
-        delete_btn.clicked.connect(self.deleteClicked.emit)
+        delete_btn.clicked.connect(self._on_delete_clicked)
         row_layout.addWidget(delete_btn)
 
     def text(self) -> str:
         return self._label.text()
 
+    @QtCore.Slot()
+    def _on_delete_clicked(self) -> None:
+        self.deleteClicked.emit(self)
+
 
 class ListEditor(QWidget):
     changed = QtCore.Signal()
@@ -64,6 +69,7 @@ class ListEditor(QWidget):
         self._items_layout.setContentsMargins(0, 0, 0, 0)
         self._items_layout.setSpacing(2)
         layout.addLayout(self._items_layout)
+        self._rows: list[ListEditorRow] = []
 
         self._input = QLineEdit()
         self._input.setPlaceholderText(placeholder)
@@ -71,28 +77,16 @@ class ListEditor(QWidget):
         layout.addWidget(self._input)
 
     def set_items(self, items: list[str]) -> None:
-        while self._items_layout.count():
-            item = self._items_layout.takeAt(0)
-            if item and (widget := item.widget()):
-                widget.deleteLater()
+        for row in self._rows:
+            self._items_layout.removeWidget(row)
+            row.deleteLater()
+        self._rows.clear()
         for text in items:
             if text.strip():
                 self._add_row(text)
 
     def get_items(self) -> list[str]:
-        items: list[str] = []
-        for i in range(self._items_layout.count()):
-            if row := self._get_row(i):
-                items.append(row.text())
-        return items
-
-    def _get_row(self, index: int) -> ListEditorRow | None:
-        child = self._items_layout.itemAt(index)
-        if not child:
-            return None
-        row = child.widget()
-        if isinstance(row, ListEditorRow):
-            return row
+        return [row.text() for row in self._rows]
 
     def _on_return_pressed(self) -> None:
         text = self._input.text().strip()
@@ -104,10 +98,13 @@ class ListEditor(QWidget):
 
     def _add_row(self, text: str) -> None:
         row = ListEditorRow(text)
-        row.deleteClicked.connect(lambda: self._remove_row(row))
+        row.deleteClicked.connect(self._remove_row)
         self._items_layout.addWidget(row)
+        self._rows.append(row)
 
+    @QtCore.Slot(object)
     def _remove_row(self, row: ListEditorRow) -> None:
+        self._rows.remove(row)
         self._items_layout.removeWidget(row)
         row.deleteLater()
         self.changed.emit()
@@ -150,7 +147,7 @@ class DurationInputWidget(QWidget):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(self._spin)
-        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        self.setSizePolicy(Fixed, Fixed)
         self.setMaximumWidth(DURATION_INPUT_MAX_WIDTH)
 
     def value(self) -> int:
@@ -37,13 +37,32 @@ QPushButton {
     font-size: 18px;
     padding: 10px 26px;
 }
+#PromptOverlay QPushButton {
+    font-size: 20px;
+    font-weight: 600;
+    padding: 18px 32px;
+    background: palette(button);
+    border: 1px solid palette(mid);
+    border-radius: 12px;
+    color: palette(button-text);
+    text-align: center;
+}
+#PromptOverlay QPushButton:hover {
+    background: palette(midlight);
+    border-color: palette(dark);
+}
+#PromptOverlay QPushButton:checked {
+    background: palette(highlight);
+    border-color: palette(highlight);
+    color: palette(highlighted-text);
+}
 """
 
 
-SUBMIT_SHORTCUTS = [
+SUBMIT_SHORTCUTS = (
     QtGui.QKeySequence("Ctrl+Return"),
     QtGui.QKeySequence("Ctrl+Enter"),
-]
+)
 
 
 class CheckInScreen(QtWidgets.QDialog):
@@ -81,8 +100,10 @@ class CheckInScreen(QtWidgets.QDialog):
         self.setStyleSheet(STYLESHEET)
 
     def _install_submit_shortcuts(self) -> None:
-        for shortcut in SUBMIT_SHORTCUTS:
-            QtGui.QShortcut(shortcut, self).activated.connect(self._on_submit)
+        self._submit_action = QtGui.QAction(self)
+        self._submit_action.setShortcuts(SUBMIT_SHORTCUTS)
+        self._submit_action.triggered.connect(self._on_submit)
+        self.addAction(self._submit_action)
 
     def _build_layout(self) -> QtWidgets.QVBoxLayout:
         layout = QtWidgets.QVBoxLayout()
@@ -129,12 +150,13 @@ class CheckInScreen(QtWidgets.QDialog):
             super().keyPressEvent(event)
 
     def _on_submit(self) -> None:
-        if self._prompt_card.answer == "":
+        answer = self._prompt_card.answer
+        if answer == "":
             return
         record = CheckInRecord(
             timestamp=datetime.now(timezone.utc),
             prompt=self._prompt_card.prompt,
-            answer=self._prompt_card.answer,
+            answer=answer,
             fulluse_rating=self._fulluse_rating_widget.rating,
             exercise_name=self._exercise_widget.exercise_name,
             exercise_rep_count=self._exercise_widget.rep_count,
@@ -2,6 +2,7 @@ from typing import cast, get_args
 
 from PySide6 import QtCore, QtGui
 from PySide6.QtWidgets import (
+    QButtonGroup,
     QComboBox,
     QGridLayout,
     QHBoxLayout,
@@ -16,27 +17,14 @@ from PySide6.QtWidgets import (
 
 from pymodoro.metrics_io import ExerciseResult, FulluseRating, Leverage
 
-_OVERLAY_STYLESHEET = """
-    #PromptOverlay QPushButton {
-        font-size: 20px;
-        font-weight: 600;
-        padding: 18px 32px;
-        background: palette(button);
-        border: 1px solid palette(mid);
-        border-radius: 12px;
-        color: palette(button-text);
-        text-align: center;
-    }
-    #PromptOverlay QPushButton:hover {
-        background: palette(midlight);
-        border-color: palette(dark);
-    }
-    #PromptOverlay QPushButton:checked {
-        background: palette(highlight);
-        border-color: palette(highlight);
-        color: palette(highlighted-text);
-    }
-"""
+Key = QtCore.Qt.Key
+KeyPress = QtCore.QEvent.Type.KeyPress
+ClickFocus = QtCore.Qt.FocusPolicy.ClickFocus
+TabFocus = QtCore.Qt.FocusPolicy.TabFocus
+TabFocusReason = QtCore.Qt.FocusReason.TabFocusReason
+Expanding = QSizePolicy.Policy.Expanding
+Fixed = QSizePolicy.Policy.Fixed
+Preferred = QSizePolicy.Policy.Preferred
 
 
 class _PromptOverlay(QWidget):
@@ -48,8 +36,8 @@ class _PromptOverlay(QWidget):
         self._highlighted = prompts.index(current) if current in prompts else 0
         self._buttons: list[QPushButton] = []
 
+        # Styled by the "#PromptOverlay" rules of the check-in screen stylesheet.
         self.setObjectName("PromptOverlay")
-        self.setStyleSheet(_OVERLAY_STYLESHEET)
         self.setGeometry(parent.rect())
         self._build_ui()
         self.show()
@@ -73,9 +61,7 @@ class _PromptOverlay(QWidget):
             btn.setCheckable(True)
             btn.setAutoDefault(False)
             btn.setDefault(False)
-            btn.setSizePolicy(
-                QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
-            )
+            btn.setSizePolicy(Expanding, Preferred)
             btn.clicked.connect(self._make_click_handler(i))
             self._buttons.append(btn)
             outer.addWidget(btn)
@@ -96,16 +82,16 @@ class _PromptOverlay(QWidget):
 
     def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
         key = event.key()
-        if key == QtCore.Qt.Key.Key_Up:
+        if key == Key.Key_Up:
             self._highlighted = (self._highlighted - 1) % len(self._prompts)
             self._update_highlight()
-        elif key == QtCore.Qt.Key.Key_Down:
+        elif key == Key.Key_Down:
             self._highlighted = (self._highlighted + 1) % len(self._prompts)
             self._update_highlight()
-        elif key in (QtCore.Qt.Key.Key_Return, QtCore.Qt.Key.Key_Enter):
+        elif key in (Key.Key_Return, Key.Key_Enter):
             self.prompt_selected.emit(self._prompts[self._highlighted])
             self.close()
-        elif key == QtCore.Qt.Key.Key_Escape:
+        elif key == Key.Key_Escape:
             self.close()
         else:
             super().keyPressEvent(event)
@@ -171,6 +157,8 @@ class PromptCard(QWidget):
 
     @property
     def answer(self) -> str:
+        if self._input.document().isEmpty():
+            return ""
         return self._input.toPlainText().strip()
 
     def focus_input(self) -> None:
@@ -191,8 +179,12 @@ class _ExclusiveToggleRow(QWidget):
         parent: QWidget | None = None,
     ) -> None:
         super().__init__(parent)
+        self._options = list(options)
         self._selected: str | None = None
         self._buttons: list[QPushButton] = []
+        self._group = QButtonGroup(self)
+        self._group.setExclusive(True)
+        self._group.idClicked.connect(self._on_button_clicked)
         tooltips = tooltips or {}
 
         layout = QHBoxLayout(self)
@@ -210,69 +202,60 @@ class _ExclusiveToggleRow(QWidget):
         btn.setDefault(False)
         if option in tooltips:
             btn.setToolTip(tooltips[option])
-        btn.clicked.connect(self._make_handler(option, btn))
         btn.installEventFilter(self)
+        self._group.addButton(btn, len(self._buttons))
         self._buttons.append(btn)
         return btn
 
     def _update_tab_focus(self) -> None:
         """Make only the checked (or first) button tabbable."""
-        target = None
-        for btn in self._buttons:
-            if btn.isChecked():
-                target = btn
-                break
+        target = self._group.checkedButton()
         if target is None and self._buttons:
             target = self._buttons[0]
         for btn in self._buttons:
-            btn.setFocusPolicy(
-                QtCore.Qt.FocusPolicy.TabFocus
-                if btn is target
-                else QtCore.Qt.FocusPolicy.ClickFocus
-            )
+            btn.setFocusPolicy(TabFocus if btn is target else ClickFocus)
 
     def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
-        if event.type() == QtCore.QEvent.Type.KeyPress:
+        if event.type() == KeyPress:
             key = cast(QtGui.QKeyEvent, event).key()
             buttons = self._buttons
-            tab_focus_reason = QtCore.Qt.FocusReason.TabFocusReason
             # Left/Right arrows: move focus between buttons
-            if key in (QtCore.Qt.Key.Key_Left, QtCore.Qt.Key.Key_Right):
+            if key in (Key.Key_Left, Key.Key_Right):
                 try:
                     idx = buttons.index(cast(QPushButton, obj))
                 except ValueError:
                     return False
-                delta = -1 if key == QtCore.Qt.Key.Key_Left else 1
-                buttons[(idx + delta) % len(buttons)].setFocus(tab_focus_reason)
+                delta = -1 if key == Key.Key_Left else 1
+                buttons[(idx + delta) % len(buttons)].setFocus(TabFocusReason)
                 return True
             # Up/Down arrows: leave the row entirely
-            if key in (QtCore.Qt.Key.Key_Up, QtCore.Qt.Key.Key_Down):
+            if key in (Key.Key_Up, Key.Key_Down):
                 for btn in buttons:
-                    btn.setFocusPolicy(QtCore.Qt.FocusPolicy.ClickFocus)
-                cast(QWidget, obj).focusNextPrevChild(key == QtCore.Qt.Key.Key_Down)
+                    btn.setFocusPolicy(ClickFocus)
+                cast(QWidget, obj).focusNextPrevChild(key == Key.Key_Down)
                 self._update_tab_focus()
                 return True
             # Number keys: select Nth button
-            if QtCore.Qt.Key.Key_1 <= key <= QtCore.Qt.Key.Key_9:
-                n = key - QtCore.Qt.Key.Key_1
+            if Key.Key_1 <= key <= Key.Key_9:
+                n = key - Key.Key_1
                 if n < len(buttons):
                     buttons[n].click()
-                    buttons[n].setFocus(tab_focus_reason)
+                    buttons[n].setFocus(TabFocusReason)
                 return True
         return super().eventFilter(obj, event)
 
-    def _make_handler(self, value: str, button: QPushButton):
-        def handler() -> None:
-            if self._selected == value:
-                self._selected = None
-                button.setChecked(False)
-            else:
-                self._selected = value
-                for btn in self._buttons:
-                    btn.setChecked(btn is button)
-            self._update_tab_focus()
-
-        return handler
+    @QtCore.Slot(int)
+    def _on_button_clicked(self, index: int) -> None:
+        option = self._options[index]
+        if self._selected == option:
+            # An exclusive group never unchecks its checked button by itself.
+            self._group.setExclusive(False)
+            self._buttons[index].setChecked(False)
+            self._group.setExclusive(True)
+            self._selected = None
+        else:
+            self._selected = option
+        self._update_tab_focus()
 
     @property
     def selected(self) -> str | None:
@@ -283,13 +266,10 @@ class FulluseRatingWidget(_ExclusiveToggleRow):
     """Fulluse rating selector with 1-5 buttons."""
 
     _OPTIONS = [str(v) for v in range(1, 6)]
+    _TOOLTIPS = {"1": "Very distracted", "5": "Deep focus"}
 
     def __init__(self, parent: QWidget | None = None) -> None:
-        super().__init__(
-            self._OPTIONS,
-            tooltips={"1": "Very distracted", "5": "Deep focus"},
-            parent=parent,
-        )
+        super().__init__(self._OPTIONS, tooltips=self._TOOLTIPS, parent=parent)
 
     @property
     def rating(self) -> FulluseRating:
@@ -314,10 +294,7 @@ class ExerciseWidget(QWidget):
         self._combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
         self._combo.addItems(exercises)
         self._combo.setCurrentIndex(-1)
-        self._combo.setSizePolicy(
-            QSizePolicy.Policy.Expanding,
-            QSizePolicy.Policy.Fixed,
-        )
+        self._combo.setSizePolicy(Expanding, Fixed)
         if (line_edit := self._combo.lineEdit()) is not None:
             line_edit.setPlaceholderText("Select an exercise...")
 
@@ -357,10 +334,7 @@ class ProjectWidget(QWidget):
         self._combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
         self._combo.addItems(projects)
         self._combo.setCurrentIndex(-1)
-        self._combo.setSizePolicy(
-            QSizePolicy.Policy.Expanding,
-            QSizePolicy.Policy.Fixed,
-        )
+        self._combo.setSizePolicy(Expanding, Fixed)
         if (line_edit := self._combo.lineEdit()) is not None:
             line_edit.setPlaceholderText("Select a project...")
 
@@ -4,7 +4,6 @@ from pathlib import Path
 
 import typer
 
-from pymodoro.app import PomodoroApp
 from pymodoro.settings import DEFAULT_SETTINGS_PATH, load_settings
 
 cli = typer.Typer(add_completion=False)
@@ -18,6 +17,9 @@ def run(
         help="Path to settings file.",
     ),
 ) -> None:
+    # Deferred so --help does not have to load Qt.
+    from pymodoro.app import PomodoroApp
+
     settings = load_settings(settings_path)
     app = PomodoroApp(settings=settings)
     app.launch()
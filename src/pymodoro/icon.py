@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 
 from pymodoro.session import SessionPhase
@@ -13,8 +14,13 @@ _PHASE_ICON_FILES = {
 }
 
 
+@functools.cache
+def _load_phase_icon(phase: SessionPhase) -> QtGui.QIcon:
+    # Loaded on first use: QIcon needs a running QGuiApplication.
+    return QtGui.QIcon(str(_PHASE_ICON_FILES[phase]))
+
+
 def phase_icon(phase: SessionPhase | None = None) -> QtGui.QIcon:
-    if phase is None:
+    if phase not in _PHASE_ICON_FILES:
         phase = SessionPhase.BREAK
-    svg_path = _PHASE_ICON_FILES.get(phase, _PHASE_ICON_FILES[SessionPhase.BREAK])
-    return QtGui.QIcon(str(svg_path))
+    return _load_phase_icon(phase)
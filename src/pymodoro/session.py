@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from enum import Enum
+from enum import StrEnum
 from typing import cast
 
 from loguru import logger
@@ -16,12 +16,15 @@ LATE_FINISH_RESTART_THRESHOLD_SEC = 300
 PHASE_CHANGE_WARNING_SEC = 60
 SLEEP_GAP_THRESHOLD_SEC = 30
 
+ENDS_AT_TODAY_FORMAT = "HH:mm"
+ENDS_AT_LATER_FORMAT = "yyyy-MM-dd HH:mm"
+
 
 def _qdatetime_to_utc(qdt: QtCore.QDateTime) -> datetime:
     return cast(datetime, qdt.toPython()).astimezone(timezone.utc)
 
 
-class SessionPhase(str, Enum):
+class SessionPhase(StrEnum):
     WORK = "Work"
     BREAK = "Break"
     PAUSE = "Pause"
@@ -52,14 +55,18 @@ class SleepRecoveryTimer(QtCore.QObject):
 
         self._phase_timer = QtCore.QTimer(self)
         self._phase_timer.setSingleShot(True)
+        self._phase_timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
         self._phase_timer.timeout.connect(self._on_phase_timer_timeout)
 
         self._heartbeat_timer = QtCore.QTimer(self)
+        # Only has to notice multi-second gaps; let the OS batch its wakeups.
+        self._heartbeat_timer.setTimerType(QtCore.Qt.TimerType.VeryCoarseTimer)
         self._heartbeat_timer.setInterval(heartbeat_interval_sec * 1000)
         self._heartbeat_timer.timeout.connect(self._on_heartbeat_timeout)
 
         self._phase_warning_timer = QtCore.QTimer(self)
         self._phase_warning_timer.setSingleShot(True)
+        self._phase_warning_timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
         self._phase_warning_timer.timeout.connect(self.phaseEndingSoon.emit)
 
         self._ends_at: QtCore.QDateTime | None = None
@@ -77,9 +84,7 @@ class SleepRecoveryTimer(QtCore.QObject):
         self._effective_end = None
         self._accumulated_sleep_seconds = 0
 
-        self._phase_timer.stop()
-        self._phase_timer.setInterval(duration_seconds * 1000)
-        self._phase_timer.start()
+        self._phase_timer.start(duration_seconds * 1000)
         self._schedule_phase_warning(now)
 
         if not self._heartbeat_timer.isActive():
@@ -102,9 +107,7 @@ class SleepRecoveryTimer(QtCore.QObject):
         now = QtCore.QDateTime.currentDateTime()
         self._ends_at = self._ends_at.addSecs(seconds)
         remaining_seconds = round(now.msecsTo(self._ends_at) / 1000)
-        self._phase_timer.stop()
-        self._phase_timer.setInterval(remaining_seconds * 1000)
-        self._phase_timer.start()
+        self._phase_timer.start(remaining_seconds * 1000)
         self._schedule_phase_warning(now)
 
         if not self._heartbeat_timer.isActive():
@@ -143,11 +146,13 @@ class SleepRecoveryTimer(QtCore.QObject):
         self._last_heartbeat_at = now
         return fell_asleep_at
 
+    @QtCore.Slot()
     def _on_phase_timer_timeout(self) -> None:
         self._phase_warning_timer.stop()
         self._effective_end = _qdatetime_to_utc(QtCore.QDateTime.currentDateTime())
         self.finished.emit(self._effective_end)
 
+    @QtCore.Slot()
     def _on_heartbeat_timeout(self) -> None:
         now = QtCore.QDateTime.currentDateTime()
         fell_asleep_at = self._detect_sleep_gap(now)
@@ -167,9 +172,7 @@ class SleepRecoveryTimer(QtCore.QObject):
             self.finished.emit(self._effective_end)
             return
 
-        self._phase_timer.stop()
-        self._phase_timer.setInterval(remaining_seconds * 1000)
-        self._phase_timer.start()
+        self._phase_timer.start(remaining_seconds * 1000)
         self._schedule_phase_warning(now)
 
     def _schedule_phase_warning(self, now: QtCore.QDateTime) -> None:
@@ -211,41 +214,46 @@ class SessionPhaseManager(QtCore.QObject):
         self.start_work_phase()
 
     def resume(self) -> None:
-        if self._phase == SessionPhase.PAUSE:
+        if self._phase is SessionPhase.PAUSE:
             self.start_work_phase()
 
+    @QtCore.Slot(object)
     def _on_timer_finished(self, effective_end: datetime) -> None:
         now = datetime.now(timezone.utc)
         missed_by_seconds = int((now - effective_end).total_seconds())
         if missed_by_seconds > LATE_FINISH_RESTART_THRESHOLD_SEC:
-            logger.warning(f"Phase late by {missed_by_seconds}s. Restarting.")
+            logger.warning("Phase late by {}s. Restarting.", missed_by_seconds)
             self.start()
             return
 
-        if self._phase == SessionPhase.WORK:
+        if self._phase is SessionPhase.WORK:
             self.workEnded.emit()
             self.start_break_phase()
-        elif self._phase == SessionPhase.BREAK:
+        elif self._phase is SessionPhase.BREAK:
             self.breakEnded.emit()
-        elif self._phase == SessionPhase.PAUSE:
+        elif self._phase is SessionPhase.PAUSE:
             self.start_work_phase()
 
     def start_work_phase(self, seconds: int | None = None) -> None:
-        seconds = seconds or self._settings.timers.work_duration
+        if seconds is None:
+            seconds = self._settings.timers.work_duration
         self._start_phase(SessionPhase.WORK, seconds)
 
     def start_break_phase(self, seconds: int | None = None) -> None:
-        seconds = seconds or self._settings.timers.break_duration
+        if seconds is None:
+            seconds = self._settings.timers.break_duration
         self._start_phase(SessionPhase.BREAK, seconds)
 
+    @QtCore.Slot(QtCore.QDateTime)
     def pause_until(self, target_datetime: QtCore.QDateTime) -> None:
         seconds = QtCore.QDateTime.currentDateTime().secsTo(target_datetime)
         self._start_phase(SessionPhase.PAUSE, seconds)
 
     def extend_current_phase(self, seconds: int | None = None) -> None:
-        seconds = seconds or self._settings.timers.snooze_duration
+        if seconds is None:
+            seconds = self._settings.timers.snooze_duration
         self._timer.extend(seconds)
-        logger.info(str(self))
+        logger.opt(lazy=True).info("{}", lambda: str(self))
 
     def _start_phase(self, phase: SessionPhase, seconds: int) -> None:
         previous_phase = self._phase
@@ -259,10 +267,12 @@ class SessionPhaseManager(QtCore.QObject):
             end_timestamp=effective_end or now,
         )
         self._phase = phase
-        self.phaseChanged.emit(transition)
+        # Arm the new deadline first: phaseChanged handlers read ends_at().
         self._timer.start(seconds)
-        logger.info(str(self))
+        self.phaseChanged.emit(transition)
+        logger.opt(lazy=True).info("{}", lambda: str(self))
 
+    @QtCore.Slot()
     def _on_phase_ending_soon(self) -> None:
         self.phaseEndingSoon.emit(self._phase)
 
@@ -277,16 +287,20 @@ class SessionPhaseManager(QtCore.QObject):
         if ends_at is None:
             return "no end datetime"
         phase_ends_today: bool = ends_at.date() == QtCore.QDate.currentDate()
-        datetime_str: str = "HH:mm" if phase_ends_today else "yyyy-MM-dd HH:mm"
+        datetime_str: str = (
+            ENDS_AT_TODAY_FORMAT if phase_ends_today else ENDS_AT_LATER_FORMAT
+        )
         return ends_at.toString(datetime_str)
 
     def time_left_str(self) -> str:
         remaining_seconds = self.remaining_seconds()
         if remaining_seconds < 0:
             return "no end datetime"
-        return QtCore.QTime(0, 0).addSecs(remaining_seconds).toString("hh:mm:ss")
+        minutes, seconds = divmod(remaining_seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
     def __str__(self) -> str:
-        if self._phase == SessionPhase.PAUSE:
+        if self._phase is SessionPhase.PAUSE:
             return f"Paused until {self.ends_at_str()}"
         return f"{self._phase.value} - {self.time_left_str()}"
@@ -7,6 +7,10 @@ import yaml
 from loguru import logger
 from pydantic import BaseModel, PositiveInt
 
+# libyaml's C classes when PyYAML was built with it, the pure-Python ones otherwise.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 DEFAULT_SETTINGS_YAML = """timers:
   work_duration: 1500  # seconds (25 minutes)
   break_duration: 300  # seconds (5 minutes)
@@ -61,7 +65,7 @@ def _get_or_create_settings_file(
     if not settings_path.exists():
         logger.info("Settings file not found, creating: {}", settings_path)
         settings_path.write_text(DEFAULT_SETTINGS_YAML, encoding="utf-8")
-    return yaml.safe_load(settings_path.read_text(encoding="utf-8"))
+    return yaml.load(settings_path.read_text(encoding="utf-8"), Loader=_YamlLoader)
 
 
 def load_settings(
@@ -78,6 +82,8 @@ def save_settings(settings: AppSettings) -> None:
         mode="json", exclude={"settings_path"}, exclude_none=True
     )
     settings.settings_path.write_text(
-        yaml.dump(data, default_flow_style=False, allow_unicode=True),
+        yaml.dump(
+            data, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True
+        ),
         encoding="utf-8",
     )
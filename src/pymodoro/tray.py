@@ -7,6 +7,9 @@ from PySide6 import QtCore, QtGui, QtWidgets
 
 ActivationReason = QtWidgets.QSystemTrayIcon.ActivationReason
 AlignVCenter = QtCore.Qt.AlignmentFlag.AlignVCenter
+DialogAccepted = QtWidgets.QDialog.DialogCode.Accepted
+
+TRAY_REFRESH_INTERVAL_MS = 2000
 
 
 class TrayController(QtCore.QObject):
@@ -14,7 +17,7 @@ class TrayController(QtCore.QObject):
     openSettingsRequested = QtCore.Signal()
     checkInRequested = QtCore.Signal()
     startBreakRequested = QtCore.Signal()
-    pauseUntilRequested = QtCore.Signal(object)
+    pauseUntilRequested = QtCore.Signal(QtCore.QDateTime)
     snoozeRequested = QtCore.Signal()
     resumeRequested = QtCore.Signal()
     quitRequested = QtCore.Signal()
@@ -42,27 +45,45 @@ class TrayController(QtCore.QObject):
         self.tray.activated.connect(self._on_tray_activated)
 
         self._update_timer = QtCore.QTimer(self)
-        self._update_timer.setInterval(1000)
+        self._update_timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
+        self._update_timer.setInterval(TRAY_REFRESH_INTERVAL_MS)
         self._update_timer.timeout.connect(self.refresh)
         self._phase_end_toast: PhaseEndToast | None = None
+        self._pause_dialog: PauseUntilDialog | None = None
+        self._shown = False
+        self._tooltip_str: str | None = None
+        self._pause_action_str: str | None = None
 
     def show(self) -> None:
         self.tray.show()
-        self._update_timer.start()
+        self._shown = True
         self.refresh()
 
     def refresh(self) -> None:
         phase = self._session_phase_manager.session_phase
         if phase == SessionPhase.PAUSE:
             tooltip_str = f"Pause until {self._session_phase_manager.ends_at_str()}"
-            self._action_pause.setText("Resume")
+            pause_action_str = "Resume"
         else:
             tooltip_str = (
                 f"{phase.value} - {self._session_phase_manager.time_left_str()}"
             )
-            self._action_pause.setText("Pause until...")
-
-        self.tray.setToolTip(tooltip_str)
+            pause_action_str = "Pause until..."
+
+        # Most ticks produce the same strings; skip the Qt setters then.
+        if pause_action_str != self._pause_action_str:
+            self._action_pause.setText(pause_action_str)
+            self._pause_action_str = pause_action_str
+        if tooltip_str != self._tooltip_str:
+            self.tray.setToolTip(tooltip_str)
+            self._tooltip_str = tooltip_str
+
+        # The pause tooltip shows a fixed end time: nothing to tick until the
+        # next phase change, which calls refresh() again.
+        if phase == SessionPhase.PAUSE:
+            self._update_timer.stop()
+        elif self._shown and not self._update_timer.isActive():
+            self._update_timer.start()
 
     def show_phase_end_toast(self, text: str) -> None:
         self._ensure_phase_end_toast().show_toast(text=text)
@@ -73,12 +94,12 @@ class TrayController(QtCore.QObject):
 
     def _prompt_pause_until(self) -> QtCore.QDateTime | None:
         default_datetime = QtCore.QDateTime.currentDateTime().addSecs(3600)
-        dialog = PauseUntilDialog(default_datetime)
-        accepted_code = getattr(
-            getattr(QtWidgets.QDialog, "DialogCode", None), "Accepted", 1
-        )
-        if dialog.exec() == accepted_code:
-            return dialog.selected_datetime()
+        if self._pause_dialog is None:
+            self._pause_dialog = PauseUntilDialog(default_datetime)
+        else:
+            self._pause_dialog.set_datetime(default_datetime)
+        if self._pause_dialog.exec() == DialogAccepted:
+            return self._pause_dialog.selected_datetime()
         return None
 
     def _on_pause_action(self) -> None:
@@ -193,5 +214,8 @@ class PauseUntilDialog(QtWidgets.QDialog):
         layout.addWidget(buttons)
         self.setLayout(layout)
 
+    def set_datetime(self, value: QtCore.QDateTime) -> None:
+        self._time_picker.setDateTime(value)
+
     def selected_datetime(self) -> QtCore.QDateTime:
         return self._time_picker.dateTime()
@@ -142,6 +142,16 @@ def test_manual_start_methods_override_duration() -> None:
     assert sp_manager._timer._phase_timer.interval() == 2_000
 
 
+def test_explicit_zero_seconds_is_not_replaced_by_default() -> None:
+    settings = _make_settings(work_duration=10, break_duration=5, snooze_duration=2)
+    sp_manager = SessionPhaseManager(settings=settings)
+
+    sp_manager.start_break_phase(seconds=0)
+
+    assert sp_manager.session_phase == SessionPhase.BREAK
+    assert sp_manager._timer._phase_timer.interval() == 0
+
+
 def test_manual_start_methods_force_switch_from_pause_and_other_phase(
     monkeypatch: Any,
 ) -> None:
@@ -309,6 +319,15 @@ def test_manager_time_left_str_uses_remaining_seconds(monkeypatch: Any) -> None:
     assert sp_manager.time_left_str() == "00:00:05"
 
 
+def test_manager_time_left_str_formats_hours(monkeypatch: Any) -> None:
+    settings = _make_settings(work_duration=10, break_duration=5, snooze_duration=2)
+    sp_manager = SessionPhaseManager(settings=settings)
+    sp_manager.start_work_phase(seconds=10)
+    monkeypatch.setattr(sp_manager._timer, "remaining_seconds", lambda: 3725)
+
+    assert sp_manager.time_left_str() == "01:02:05"
+
+
 def test_manager_ends_at_str_formats_today(monkeypatch: Any) -> None:
     settings = _make_settings(work_duration=10, break_duration=5, snooze_duration=2)
     sp_manager = SessionPhaseManager(settings=settings)
@@ -4,11 +4,12 @@ from pathlib import Path
 from typing import Any
 
 import pytest
-from PySide6 import QtCore, QtGui
+from PySide6 import QtCore, QtGui, QtWidgets
 
 from pymodoro.app_ui_widgets.settings_panel import AUTOSAVE_DEBOUNCE_MS, SettingsPanel
 from pymodoro.app_ui_widgets.settings_panel_widgets import ListEditor, ListEditorRow
 from pymodoro.settings import AppSettings, CheckInSettings, TimersSettings
+from pymodoro.tray import PauseUntilDialog
 
 
 @pytest.fixture
@@ -47,6 +48,28 @@ def test_auto_save_debounces_and_persists(
     assert saved == [True]
 
 
+def test_auto_save_skips_when_nothing_changed(
+    qcoreapp: Any, monkeypatch: Any, settings: AppSettings
+) -> None:
+    # Whole minutes, so the duration inputs round-trip the values exactly
+    settings.timers = TimersSettings(
+        work_duration=25 * 60, break_duration=5 * 60, snooze_duration=60
+    )
+    panel = SettingsPanel(settings)
+    write_calls: list[AppSettings] = []
+    monkeypatch.setattr(
+        "pymodoro.app_ui_widgets.settings_panel.save_settings",
+        lambda cfg: write_calls.append(cfg),
+    )
+
+    # Edit and revert before the debounce fires
+    panel._timers_group.work_duration.setValue(42 * 60)
+    panel._timers_group.work_duration.setValue(25 * 60)
+    panel._debounce_timer.timeout.emit()
+
+    assert write_calls == []
+
+
 def test_auto_save_skips_on_validation_failure(
     qcoreapp: Any, monkeypatch: Any, settings: AppSettings
 ) -> None:
@@ -213,6 +236,30 @@ def test_pause_resume_button_emits_pause_datetime_when_not_paused(
     assert emitted == [target]
 
 
+def test_pause_dialog_reopens_at_new_default(
+    qcoreapp: Any, monkeypatch: Any, settings: AppSettings
+) -> None:
+    panel = SettingsPanel(settings)
+    first_now = QtCore.QDateTime.fromString("2025-01-01 10:00", "yyyy-MM-dd HH:mm")
+    second_now = first_now.addSecs(2 * 3600)
+    user_choice = first_now.addSecs(5 * 3600)
+
+    def fake_exec(dialog: PauseUntilDialog) -> int:
+        # The first time, the user picks a different time before confirming.
+        if dialog.selected_datetime() == first_now.addSecs(3600):
+            dialog.set_datetime(user_choice)
+        return QtWidgets.QDialog.DialogCode.Accepted.value
+
+    monkeypatch.setattr(PauseUntilDialog, "exec", fake_exec)
+
+    monkeypatch.setattr(QtCore.QDateTime, "currentDateTime", lambda: first_now)
+    assert panel._prompt_pause_until() == user_choice
+    first_dialog = panel._pause_dialog
+
+    monkeypatch.setattr(QtCore.QDateTime, "currentDateTime", lambda: second_now)
+    assert panel._prompt_pause_until() == second_now.addSecs(3600)
+    assert panel._pause_dialog is first_dialog
+
 def test_start_work_click_emits_seconds_when_duration_selected(
     qcoreapp: Any, monkeypatch: Any, settings: AppSettings
 ) -> None:
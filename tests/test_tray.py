@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, Callable, cast
 
@@ -7,7 +8,8 @@ from PySide6 import QtCore
 
 import pymodoro.tray as tray_module
 from pymodoro.icon import phase_icon
-from pymodoro.session import SessionPhase
+from pymodoro.session import SessionPhase, SessionPhaseManager
+from pymodoro.settings import AppSettings, CheckInSettings, TimersSettings
 from pymodoro.tray import ActivationReason, TrayController
 
 
@@ -310,3 +312,91 @@ def test_hide_phase_end_toast_hides_active_toast(
 
     snackbar = cast(DummySnackbar, tray._phase_end_toast)
     assert snackbar.hide_calls == 1
+
+
+def test_refresh_stops_update_timer_while_paused(
+    qcoreapp: QtCore.QCoreApplication, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(tray_module.QtWidgets, "QSystemTrayIcon", DummyTray)
+    monkeypatch.setattr(tray_module.QtWidgets, "QMenu", DummyMenu)
+
+    sp_manager = DummySessionPhaseManager(SessionPhase.WORK, remaining_seconds=60)
+    tray = TrayController(
+        app=cast(Any, SimpleNamespace()),
+        session_phase_manager=cast(Any, sp_manager),
+    )
+    tray.show()
+    assert tray._update_timer.isActive()
+
+    sp_manager.session_phase = SessionPhase.PAUSE
+    tray.refresh()
+    assert not tray._update_timer.isActive()
+
+    sp_manager.session_phase = SessionPhase.WORK
+    tray.refresh()
+    assert tray._update_timer.isActive()
+
+
+def test_pause_tooltip_shows_pause_target_after_phase_change(
+    qcoreapp: QtCore.QCoreApplication, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(tray_module.QtWidgets, "QSystemTrayIcon", DummyTray)
+    monkeypatch.setattr(tray_module.QtWidgets, "QMenu", DummyMenu)
+    fixed_now = QtCore.QDateTime.fromString("2025-01-01 10:00", "yyyy-MM-dd HH:mm")
+    monkeypatch.setattr(QtCore.QDateTime, "currentDateTime", lambda: fixed_now)
+    monkeypatch.setattr(QtCore.QDate, "currentDate", lambda: fixed_now.date())
+
+    settings = AppSettings(
+        timers=TimersSettings(
+            work_duration=1500, break_duration=300, snooze_duration=60
+        ),
+        check_in=CheckInSettings(prompts=["Prompt"]),
+        settings_path=Path("/tmp/settings.yaml"),
+    )
+    sp_manager = SessionPhaseManager(settings=settings)
+    tray = TrayController(
+        app=cast(Any, SimpleNamespace()),
+        session_phase_manager=sp_manager,
+    )
+    # Same wiring as PomodoroApp._on_phase_changed
+    sp_manager.phaseChanged.connect(lambda _: tray.refresh())
+    sp_manager.start_work_phase()
+    tray.show()
+
+    sp_manager.pause_until(fixed_now.addSecs(3 * 3600))
+
+    tray_icon = cast(DummyTray, tray.tray)
+    assert tray_icon.tooltip == "Pause until 13:00"
+    assert not tray._update_timer.isActive()
+
+
+def test_pause_dialog_reopens_at_new_default(
+    qcoreapp: QtCore.QCoreApplication, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(tray_module.QtWidgets, "QSystemTrayIcon", DummyTray)
+    monkeypatch.setattr(tray_module.QtWidgets, "QMenu", DummyMenu)
+
+    sp_manager = DummySessionPhaseManager(SessionPhase.WORK, remaining_seconds=0)
+    tray = TrayController(
+        app=cast(Any, SimpleNamespace()),
+        session_phase_manager=cast(Any, sp_manager),
+    )
+    first_now = QtCore.QDateTime.fromString("2025-01-01 10:00", "yyyy-MM-dd HH:mm")
+    second_now = first_now.addSecs(2 * 3600)
+    user_choice = first_now.addSecs(5 * 3600)
+
+    def fake_exec(dialog: tray_module.PauseUntilDialog) -> int:
+        # The first time, the user picks a different time before confirming.
+        if dialog.selected_datetime() == first_now.addSecs(3600):
+            dialog.set_datetime(user_choice)
+        return tray_module.DialogAccepted.value
+
+    monkeypatch.setattr(tray_module.PauseUntilDialog, "exec", fake_exec)
+
+    monkeypatch.setattr(QtCore.QDateTime, "currentDateTime", lambda: first_now)
+    assert tray._prompt_pause_until() == user_choice
+    first_dialog = tray._pause_dialog
+
+    monkeypatch.setattr(QtCore.QDateTime, "currentDateTime", lambda: second_now)
+    assert tray._prompt_pause_until() == second_now.addSecs(3600)
+    assert tray._pause_dialog is first_dialog